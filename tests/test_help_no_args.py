@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+RENDER_HELP = (
+    "import sys; sys.argv = ['__main__.py', '--help'];"
+    "from typer_cli import main;"
+    "sys.exit(main.app())"
+)
+
+
+def run_fast_path(columns: str) -> str:
+    result = subprocess.run(
+        ["coverage", "run", "-m", "typer_cli", "--help"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        env={**os.environ, "COLUMNS": columns},
+    )
+    return result.stdout
+
+
+def run_click_render(columns: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", RENDER_HELP],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        env={**os.environ, "COLUMNS": columns},
+    )
+    return result.stdout
+
+
+def test_help_matches_click_render():
+    assert run_fast_path("80") == run_click_render("80")
+
+
+def test_help_wide_terminal():
+    assert run_fast_path("120") == run_click_render("120")
+
+
+def test_help_narrow_terminal():
+    assert run_fast_path("60") == run_click_render("60")
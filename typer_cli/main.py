@@ -1,45 +1,112 @@
-import importlib.util
+import functools
+import os
 import re
+import stat
 import sys
-from pathlib import Path
-from typing import Any, Iterable, List, Optional, Tuple, cast
-
-import click
-import click.core
-import typer
-from click import Command, Group, Option
-from click._bashcomplete import resolve_ctx  # type: ignore
-from click._bashcomplete import get_choices as original_get_choices
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 from . import __version__
 
-default_app_names = ("app", "cli", "main")
-default_func_names = ("main", "cli", "app")
-
-app = typer.Typer()
-utils_app = typer.Typer(help="Extra utility commands for Typer apps.")
-app.add_typer(utils_app, name="utils")
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import click  # type: ignore
+    import click._bashcomplete  # type: ignore
+    import click.core  # type: ignore
+    import typer
+    from click import Command, Group, Option
+    from click._bashcomplete import get_choices as original_get_choices, resolve_ctx
+
+# Tuples keep the ordered default lookup; the frozensets avoid rebuilding a
+# set on every dispatch
+_DEFAULT_APP_NAMES = ("app", "cli", "main")
+_DEFAULT_FUNC_NAMES = ("main", "cli", "app")
+_DEFAULT_APP_SET = frozenset(_DEFAULT_APP_NAMES)
+_DEFAULT_FUNC_SET = frozenset(_DEFAULT_FUNC_NAMES)
+
+_MODULE_RE = re.compile(r"\A[a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)*\Z")
+
+_app: Optional["typer.Typer"] = None
+
+# Bound lazily: the CLI names by _get_app(), the Click/Typer names by
+# _load_cli(); the annotations keep mypy aware of them without importing
+app: "typer.Typer"
+utils_app: "typer.Typer"
+TyperCLIGroup: Any
+callback: Any
+docs: Any
+
+_CLI_NAMES = (
+    "click",
+    "typer",
+    "Command",
+    "Group",
+    "Option",
+    "Path",
+    "resolve_ctx",
+    "original_get_choices",
+)
+_APP_NAMES = ("app", "utils_app", "TyperCLIGroup", "callback", "docs")
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: Click and Typer (and the Typer app built on top of them) are
+    # imported only on first access, keeping the module itself cheap to import.
+    if name in _CLI_NAMES:
+        _load_cli()
+        return getattr(sys.modules[__name__], name)
+    if name in _APP_NAMES:
+        _get_app()
+        return getattr(sys.modules[__name__], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_cli() -> None:
+    global click, typer, Command, Group, Option, Path, resolve_ctx, original_get_choices
+    from pathlib import Path
+
+    import click
+    import click.core
+    import typer
+    from click import Command, Group, Option
+    from click._bashcomplete import resolve_ctx  # type: ignore
+    from click._bashcomplete import get_choices as original_get_choices
 
 
 class State:
     def __init__(self) -> None:
         self.app: Optional[str] = None
         self.func: Optional[str] = None
-        self.file: Optional[Path] = None
+        self.file: Optional["Path"] = None
         self.module: Optional[str] = None
 
 
 state = State()
 
 
-def maybe_update_state(ctx: click.Context) -> None:
+def maybe_update_state(ctx: "click.Context") -> None:
     path_or_module = ctx.params.get("path_or_module")
     if path_or_module:
-        file_path = Path(path_or_module)
-        if file_path.exists() and file_path.is_file():
-            state.file = file_path
+        # A single stat call instead of Path.exists() + Path.is_file();
+        # ValueError covers paths with embedded null bytes
+        try:
+            is_file = stat.S_ISREG(os.stat(path_or_module).st_mode)
+        except (OSError, ValueError):
+            is_file = False
+        if is_file:
+            state.file = Path(path_or_module)
         else:
-            if not re.fullmatch(r"[a-zA-Z_]\w*(\.[a-zA-Z_]\w*)*", path_or_module):
+            if not _MODULE_RE.match(path_or_module):
                 typer.echo(
                     f"Not a valid file or Python module: {path_or_module}", err=True
                 )
@@ -53,173 +120,242 @@ def maybe_update_state(ctx: click.Context) -> None:
         state.func = func_name
 
 
-class TyperCLIGroup(click.Group):
-    def list_commands(self, ctx: click.Context) -> Iterable[str]:
-        self.maybe_add_run(ctx)
-        return super().list_commands(ctx)
-
-    def get_command(self, ctx: click.Context, name: str) -> Optional[Command]:
-        self.maybe_add_run(ctx)
-        return super().get_command(ctx, name)
-
-    def invoke(self, ctx: click.Context) -> Any:
-        self.maybe_add_run(ctx)
-        return super().invoke(ctx)
-
-    def maybe_add_run(self, ctx: click.Context) -> None:
-        maybe_update_state(ctx)
-        maybe_add_run_to_cli(self)
-
-
-def get_typer_from_module(module: Any) -> Optional[typer.Typer]:
+def get_typer_from_module(
+    module: Any,
+    app_name: Optional[str] = None,
+    func_name: Optional[str] = None,
+    # Default-argument binding keeps the name tables in locals on this
+    # hot path instead of module-global lookups
+    _app_names: Tuple[str, ...] = _DEFAULT_APP_NAMES,
+    _func_names: Tuple[str, ...] = _DEFAULT_FUNC_NAMES,
+    _app_set: FrozenSet[str] = _DEFAULT_APP_SET,
+    _func_set: FrozenSet[str] = _DEFAULT_FUNC_SET,
+) -> Optional["typer.Typer"]:
     # Try to get defined app
-    if state.app:
-        obj: typer.Typer = getattr(module, state.app, None)
+    if app_name:
+        obj: Optional[typer.Typer] = getattr(module, app_name, None)
         if not isinstance(obj, typer.Typer):
-            typer.echo(f"Not a Typer object: --app {state.app}", err=True)
+            typer.echo(f"Not a Typer object: --app {app_name}", err=True)
             sys.exit(1)
         return obj
     # Try to get defined function
-    if state.func:
-        func_obj = getattr(module, state.func, None)
+    if func_name:
+        func_obj = getattr(module, func_name, None)
         if not callable(func_obj):
-            typer.echo(f"Not a function: --func {state.func}", err=True)
+            typer.echo(f"Not a function: --func {func_name}", err=True)
             sys.exit(1)
         sub_app = typer.Typer()
         sub_app.command()(func_obj)
         return sub_app
-    # Iterate and get a default object to use as CLI
-    local_names = dir(module)
-    local_names_set = set(local_names)
-    # Try to get a default Typer app
-    for name in default_app_names:
-        if name in local_names_set:
-            obj = getattr(module, name, None)
-            if isinstance(obj, typer.Typer):
-                return obj
-    # Try to get any Typer app
-    for name in local_names_set - set(default_app_names):
-        obj = getattr(module, name)
+    # Iterate once and bucket candidates, then pick a default object to use
+    # as CLI in priority order: default-named Typer app, any Typer app,
+    # default-named function, any function
+    default_typers: Dict[str, typer.Typer] = {}
+    any_typer: Optional[typer.Typer] = None
+    default_funcs: Dict[str, Any] = {}
+    any_func: Any = None
+    for name, obj in vars(module).items():
         if isinstance(obj, typer.Typer):
-            return obj
-    # Try to get a default function
-    for func_name in default_func_names:
-        func_obj = getattr(module, func_name, None)
-        if callable(func_obj):
+            if name in _app_set:
+                default_typers[name] = obj
+            elif any_typer is None:
+                any_typer = obj
+        elif callable(obj):
+            if name in _func_set:
+                default_funcs[name] = obj
+            elif any_func is None:
+                any_func = obj
+    for name in _app_names:
+        if name in default_typers:
+            return default_typers[name]
+    if any_typer is not None:
+        return any_typer
+    for func_name in _func_names:
+        if func_name in default_funcs:
             sub_app = typer.Typer()
-            sub_app.command()(func_obj)
-            return sub_app
-    # Try to get any func app
-    for func_name in local_names_set - set(default_func_names):
-        func_obj = getattr(module, func_name)
-        if callable(func_obj):
-            sub_app = typer.Typer()
-            sub_app.command()(func_obj)
+            sub_app.command()(default_funcs[func_name])
             return sub_app
+    if any_func is not None:
+        sub_app = typer.Typer()
+        sub_app.command()(any_func)
+        return sub_app
     return None
 
 
-def get_typer_from_state() -> Optional[typer.Typer]:
-    spec = None
+# Resolved Typer objects by (module, app, func), so repeated dispatch doesn't
+# exec the user's module more than once per process
+_typer_obj_cache: Dict[
+    Tuple[Optional[str], Optional[str], Optional[str]], Optional["typer.Typer"]
+] = {}
+
+# Executed script modules by path, fingerprinted with (mtime_ns, size):
+# repeated queries in a long-lived process skip exec_module, edited files
+# re-exec and replace their single entry
+_module_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _get_module_from_file(file: "Path") -> Optional[Any]:
+    import importlib.util
+
+    path = str(file)
+    try:
+        st = os.stat(file)
+        fingerprint: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        fingerprint = None
+    if fingerprint is not None:
+        cached = _module_cache.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+    spec = importlib.util.spec_from_file_location(file.name, path)
+    if spec is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    if fingerprint is not None:
+        _module_cache[path] = (fingerprint, module)
+    return module
+
+
+# Last file-branch resolution as ((module, app, func), obj); keeps the
+# returned object identical across one dispatch so the run command is not
+# rebuilt, while a re-executed module naturally misses
+_last_resolution: Optional[
+    Tuple[Tuple[Any, Optional[str], Optional[str]], Optional["typer.Typer"]]
+] = None
+
+
+def get_typer_from_state() -> Optional["typer.Typer"]:
+    global _last_resolution
+    import importlib.util
+
     if state.file:
-        module_name = state.file.name
-        spec = importlib.util.spec_from_file_location(module_name, str(state.file))
-    elif state.module:
+        module = _get_module_from_file(state.file)
+        if module is None:
+            typer.echo(f"Could not import as Python file: {state.file}", err=True)
+            sys.exit(1)
+        key = (module, state.app, state.func)
+        if _last_resolution is not None and _last_resolution[0] == key:
+            return _last_resolution[1]
+        obj = get_typer_from_module(module, app_name=state.app, func_name=state.func)
+        _last_resolution = (key, obj)
+        return obj
+    key = (state.module, state.app, state.func)
+    if key in _typer_obj_cache:
+        return _typer_obj_cache[key]
+    spec = None
+    if state.module:
         spec = importlib.util.find_spec(state.module)  # type: ignore
     if spec is None:
-        if state.file:
-            typer.echo(f"Could not import as Python file: {state.file}", err=True)
-        else:
-            typer.echo(f"Could not import as Python module: {state.module}", err=True)
+        typer.echo(f"Could not import as Python module: {state.module}", err=True)
         sys.exit(1)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)  # type: ignore
-    obj = get_typer_from_module(module)
+    obj = get_typer_from_module(module, app_name=state.app, func_name=state.func)
+    _typer_obj_cache[key] = obj
     return obj
 
 
-def maybe_add_run_to_cli(cli: click.Group) -> None:
-    if "run" not in cli.commands:
-        if state.file or state.module:
-            obj = get_typer_from_state()
-            if obj:
-                obj._add_completion = False
-                click_obj = typer.main.get_command(obj)
-                click_obj.name = "run"
-                if not click_obj.help:
-                    click_obj.help = "Run the provided Typer app."
-                cli.add_command(click_obj)
+# The Typer object the current run command was built from; when resolution
+# yields a different object (e.g. the script file changed on disk), the run
+# command is rebuilt instead of served stale
+_run_obj: Optional["typer.Typer"] = None
+
+
+def maybe_add_run_to_cli(cli: "click.Group") -> None:
+    global _run_obj
+    if state.file or state.module:
+        obj = get_typer_from_state()
+        if obj and not (obj is _run_obj and "run" in cli.commands):
+            # The object is cached and shared with the docs command, so
+            # restore _add_completion after building the run command
+            add_completion = obj._add_completion
+            obj._add_completion = False
+            click_obj = typer.main.get_command(obj)
+            obj._add_completion = add_completion
+            click_obj.name = "run"
+            if not click_obj.help:
+                click_obj.help = "Run the provided Typer app."
+            cli.add_command(click_obj)
+            _run_obj = obj
+
+
+def _completion_state_key() -> Tuple[Any, ...]:
+    # Everything completion results can depend on besides argv, including the
+    # script's stat fingerprint so an edited file invalidates cached choices
+    file_key: Any = None
+    if state.file:
+        try:
+            st = os.stat(state.file)
+            file_key = (str(state.file), st.st_mtime_ns, st.st_size)
+        except OSError:
+            file_key = str(state.file)
+    return (file_key, state.module, state.app, state.func)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_choices(
+    cli: "Command",
+    prog_name: str,
+    args: Tuple[str, ...],
+    incomplete: str,
+    state_key: Tuple[Any, ...],
+) -> List[Tuple[str, str]]:
+    ctx: typer.Context = resolve_ctx(cli, prog_name, list(args))
+    if ctx.parent is None:
+        # Typer always hands the root Group here; skip the isinstance/cast
+        # dance on this per-keystroke path
+        maybe_update_state(ctx)
+        maybe_add_run_to_cli(cli)  # type: ignore
+    return original_get_choices(cli, prog_name, list(args), incomplete)
 
 
 def get_choices(
-    cli: Command, prog_name: str, args: List[str], incomplete: str
+    cli: "Command", prog_name: str, args: List[str], incomplete: str
 ) -> List[Tuple[str, str]]:
-    ctx: typer.Context = resolve_ctx(cli, prog_name, args)
-    if ctx.parent is None:
-        assert isinstance(cli, Group)
-        cli = cast(Group, cli)
-        maybe_update_state(ctx)
-        maybe_add_run_to_cli(cli)
-    return original_get_choices(cli, prog_name, args, incomplete)
+    # Completion queries are deterministic for a given argv prefix and state
+    # fingerprint, so repeated TAB presses within one process hit the cache
+    # while script edits fall through to a fresh resolution
+    return list(
+        _cached_choices(
+            cli, prog_name, tuple(args), incomplete, _completion_state_key()
+        )
+    )
 
 
-def print_version(ctx: click.Context, param: Option, value: bool) -> None:
+def print_version(ctx: "click.Context", param: "Option", value: bool) -> None:
     if not value or ctx.resilient_parsing:
         return
     typer.echo(f"Typer CLI version: {__version__}")
     raise typer.Exit()
 
 
-@app.callback(cls=TyperCLIGroup)
-def callback(
-    ctx: typer.Context,
-    *,
-    path_or_module: str = typer.Argument(None),
-    app: str = typer.Option(None, help="The typer app object/variable to use."),
-    func: str = typer.Option(None, help="The function to convert to Typer."),
-    version: bool = typer.Option(
-        False, "--version", help="Print version and exit.", callback=print_version  # type: ignore
-    ),
-) -> None:
-    """
-    Typer CLI.
-
-    Run Typer scripts with completion, without having to create a package.
-
-    You probably want to install completion for the typer command:
-
-    $ typer --install-completion
-
-    https://typer.tiangolo.com/
-    """
-    maybe_update_state(ctx)
-
-
-def get_docs_for_click(
+def _render_docs_for_click(
     *,
-    obj: Command,
-    ctx: typer.Context,
+    obj: "Command",
+    ctx: "typer.Context",
+    write: Callable[[str], Any],
     indent: int = 0,
     name: str = "",
     call_prefix: str = "",
-) -> str:
-    docs = "#" * (1 + indent)
+) -> None:
+    write("#" * (1 + indent))
     command_name = name or obj.name
     if call_prefix:
         command_name = f"{call_prefix} {command_name}"
     title = f"`{command_name}`" if command_name else "CLI"
-    docs += f" {title}\n\n"
+    write(f" {title}\n\n")
     if obj.help:
-        docs += f"{obj.help}\n\n"
+        write(f"{obj.help}\n\n")
     usage_pieces = obj.collect_usage_pieces(ctx)
     if usage_pieces:
-        docs += "**Usage**:\n\n"
-        docs += "```console\n"
-        docs += "$ "
+        write("**Usage**:\n\n")
+        write("```console\n")
+        write("$ ")
         if command_name:
-            docs += f"{command_name} "
-        docs += f"{' '.join(usage_pieces)}\n"
-        docs += "```\n\n"
+            write(f"{command_name} ")
+        write(f"{' '.join(usage_pieces)}\n")
+        write("```\n\n")
     args = []
     opts = []
     for param in obj.get_params(ctx):
@@ -230,77 +366,251 @@ def get_docs_for_click(
             elif param.param_type_name == "option":
                 opts.append(rv)
     if args:
-        docs += f"**Arguments**:\n\n"
+        write(f"**Arguments**:\n\n")
         for arg_name, arg_help in args:
-            docs += f"* `{arg_name}`"
+            write(f"* `{arg_name}`")
             if arg_help:
-                docs += f": {arg_help}"
-            docs += "\n"
-        docs += "\n"
+                write(f": {arg_help}")
+            write("\n")
+        write("\n")
     if opts:
-        docs += f"**Options**:\n\n"
+        write(f"**Options**:\n\n")
         for opt_name, opt_help in opts:
-            docs += f"* `{opt_name}`"
+            write(f"* `{opt_name}`")
             if opt_help:
-                docs += f": {opt_help}"
-            docs += "\n"
-        docs += "\n"
+                write(f": {opt_help}")
+            write("\n")
+        write("\n")
     if obj.epilog:
-        docs += f"{obj.epilog}\n\n"
+        write(f"{obj.epilog}\n\n")
     if isinstance(obj, Group):
-        group: Group = cast(Group, obj)
-        commands = group.list_commands(ctx)
-        if commands:
-            docs += f"**Commands**:\n\n"
-            for command in commands:
-                command_obj = group.get_command(ctx, command)
-                assert command_obj
-                docs += f"* `{command_obj.name}`"
-                command_help = command_obj.get_short_help_str()
-                if command_help:
-                    docs += f": {command_help}"
-                docs += "\n"
-            docs += "\n"
-        for command in commands:
+        group: Group = cast("Group", obj)
+        # Resolve each subcommand once; get_command re-enters maybe_add_run
+        # for TyperCLIGroup, so the summary and the recursion share the lookup
+        resolved = []
+        for command in group.list_commands(ctx):
             command_obj = group.get_command(ctx, command)
             assert command_obj
+            resolved.append(command_obj)
+        if resolved:
+            write(f"**Commands**:\n\n")
+            for command_obj in resolved:
+                write(f"* `{command_obj.name}`")
+                command_help = command_obj.get_short_help_str()
+                if command_help:
+                    write(f": {command_help}")
+                write("\n")
+            write("\n")
+        for command_obj in resolved:
             use_prefix = ""
             if command_name:
                 use_prefix += f"{command_name}"
-            docs += get_docs_for_click(
-                obj=command_obj, ctx=ctx, indent=indent + 1, call_prefix=use_prefix
+            _render_docs_for_click(
+                obj=command_obj,
+                ctx=ctx,
+                write=write,
+                indent=indent + 1,
+                call_prefix=use_prefix,
             )
-    return docs
-
-
-@utils_app.command()
-def docs(
-    ctx: typer.Context,
-    name: str = typer.Option("", help="The name of the CLI program to use in docs."),
-    output: Path = typer.Option(
-        None,
-        help="An output file to write docs to, like README.md.",
-        file_okay=True,
-        dir_okay=False,
-    ),
+
+
+def _stream_clean_docs(
+    write: Callable[[str], Any], *, obj: "Command", ctx: "typer.Context", name: str
 ) -> None:
-    """
-    Generate Markdown docs for a Typer app.
-    """
-    typer_obj = get_typer_from_state()
-    if not typer_obj:
-        typer.echo(f"No Typer app found", err=True)
-        raise typer.Abort()
-    click_obj = typer.main.get_command(typer_obj)
-    docs = get_docs_for_click(obj=click_obj, ctx=ctx, name=name)
-    clean_docs = f"{docs.strip()}\n"
-    if output:
-        output.write_text(clean_docs)
-        typer.echo(f"Docs saved to: {output}")
-    else:
-        typer.echo(clean_docs)
+    # Stream fragments with the surrounding whitespace stripped and exactly
+    # one trailing newline, without materializing the whole document:
+    # leading whitespace is dropped, trailing whitespace is held back until
+    # more content arrives
+    pending: List[str] = []
+    started = False
+
+    def clean_write(fragment: str) -> None:
+        nonlocal started
+        if not started:
+            fragment = fragment.lstrip()
+            if not fragment:
+                return
+            started = True
+        core = fragment.rstrip()
+        if core:
+            if pending:
+                write("".join(pending))
+                pending.clear()
+            write(core)
+            tail = fragment[len(core) :]
+            if tail:
+                pending.append(tail)
+        else:
+            pending.append(fragment)
+
+    _render_docs_for_click(obj=obj, ctx=ctx, write=clean_write, name=name)
+    write("\n")
+
+
+def get_docs_for_click(
+    *,
+    obj: "Command",
+    ctx: "typer.Context",
+    indent: int = 0,
+    name: str = "",
+    call_prefix: str = "",
+) -> str:
+    parts: List[str] = []
+    _render_docs_for_click(
+        obj=obj,
+        ctx=ctx,
+        write=parts.append,
+        indent=indent,
+        name=name,
+        call_prefix=call_prefix,
+    )
+    return "".join(parts)
+
+
+def _get_app() -> "typer.Typer":
+    global _app, app, utils_app, TyperCLIGroup, callback, docs
+    if _app is not None:
+        return _app
+    _load_cli()
+
+    class TyperCLIGroup(click.Group):
+        def list_commands(self, ctx: click.Context) -> List[str]:
+            self.maybe_add_run(ctx)
+            return super().list_commands(ctx)
+
+        def get_command(self, ctx: click.Context, name: str) -> Optional[Command]:
+            self.maybe_add_run(ctx)
+            return super().get_command(ctx, name)
+
+        def invoke(self, ctx: click.Context) -> Any:
+            self.maybe_add_run(ctx)
+            return super().invoke(ctx)
+
+        def maybe_add_run(self, ctx: click.Context) -> None:
+            # Nothing to resolve for e.g. `typer --help`: no script was
+            # given, so skip the state update and run wiring entirely
+            if (
+                state.file is None
+                and state.module is None
+                and not ctx.params.get("path_or_module")
+            ):
+                return
+            maybe_update_state(ctx)
+            # maybe_add_run_to_cli short-circuits on its own when the
+            # resolved object is unchanged, so no flag is needed here
+            maybe_add_run_to_cli(self)
+
+    app = typer.Typer()
+    utils_app = typer.Typer(help="Extra utility commands for Typer apps.")
+    app.add_typer(utils_app, name="utils")
+
+    @app.callback(cls=TyperCLIGroup)
+    def callback(
+        ctx: typer.Context,
+        *,
+        path_or_module: str = typer.Argument(None),
+        app: str = typer.Option(None, help="The typer app object/variable to use."),
+        func: str = typer.Option(None, help="The function to convert to Typer."),
+        version: bool = typer.Option(
+            False, "--version", help="Print version and exit.", callback=print_version  # type: ignore
+        ),
+    ) -> None:
+        """
+        Typer CLI.
+
+        Run Typer scripts with completion, without having to create a package.
+
+        You probably want to install completion for the typer command:
+
+        $ typer --install-completion
+
+        https://typer.tiangolo.com/
+        """
+        maybe_update_state(ctx)
+
+    @utils_app.command()
+    def docs(
+        ctx: typer.Context,
+        name: str = typer.Option(
+            "", help="The name of the CLI program to use in docs."
+        ),
+        output: Path = typer.Option(
+            None,
+            help="An output file to write docs to, like README.md.",
+            file_okay=True,
+            dir_okay=False,
+        ),
+    ) -> None:
+        """
+        Generate Markdown docs for a Typer app.
+        """
+        typer_obj = get_typer_from_state()
+        if not typer_obj:
+            typer.echo(f"No Typer app found", err=True)
+            raise typer.Abort()
+        click_obj = typer.main.get_command(typer_obj)
+        if output:
+            with output.open("w") as out:
+                _stream_clean_docs(out.write, obj=click_obj, ctx=ctx, name=name)
+            typer.echo(f"Docs saved to: {output}")
+        else:
+            # click's wrapped stdout keeps the Windows console handling
+            # that typer.echo provided
+            out_stream = click.get_text_stream("stdout")
+            _stream_clean_docs(out_stream.write, obj=click_obj, ctx=ctx, name=name)
+            # typer.echo appended a newline after the document; keep it
+            out_stream.write("\n")
+
+    _app = app
+    return _app
+
+
+# Pre-rendered copy of the Click help for the bare `typer --help` invocation
+# at Click's 80-column cap; tests/test_help_no_args.py pins it to the real
+# render so it cannot drift when the callback or options change.
+_HELP_TEXT = """\
+Usage: {prog} [OPTIONS] [PATH_OR_MODULE] COMMAND [ARGS]...
+
+  Typer CLI.
+
+  Run Typer scripts with completion, without having to create a package.
+
+  You probably want to install completion for the typer command:
+
+  $ typer --install-completion
+
+  https://typer.tiangolo.com/
+
+Options:
+  [PATH_OR_MODULE]
+  --app TEXT            The typer app object/variable to use.
+  --func TEXT           The function to convert to Typer.
+  --version             Print version and exit.  [default: False]
+  --install-completion  Install completion for the current shell.
+  --show-completion     Show completion for the current shell, to copy it or
+                        customize the installation.
+
+  --help                Show this message and exit.
+
+Commands:
+  utils  Extra utility commands for Typer apps."""
 
 
 def main() -> Any:
+    # Fast path: answer --version/--help without paying the Click/Typer
+    # import cost when no real command has to execute
+    if len(sys.argv) == 2:
+        if sys.argv[1] == "--version":
+            print(f"Typer CLI version: {__version__}")
+            return 0
+        if sys.argv[1] == "--help":
+            import shutil
+
+            # Click caps help at 80 columns; in a narrower terminal fall
+            # through so the wrapping matches the real formatter
+            if shutil.get_terminal_size().columns >= 80:
+                print(_HELP_TEXT.format(prog=os.path.basename(sys.argv[0])))
+                return 0
+    app = _get_app()
     click._bashcomplete.get_choices = get_choices
     return app()